@@ -1,8 +1,18 @@
 import requests
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
 from utils.rate_limiter import RateLimiter
 
+# Try to import orjson for faster parsing of large profile responses
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+
 # Custom Exceptions for this module
 class HypixelAPIError(Exception):
     """Base exception for Hypixel API client errors."""
@@ -21,6 +31,9 @@ class HypixelAPI:
     
     BASE_URL = "https://api.hypixel.net"
     
+    # Parsed bodies kept for conditional requests; the client is shared across sessions
+    CONDITIONAL_CACHE_SIZE = 64
+    
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.rate_limiter = RateLimiter(max_requests=100, time_window=300)  # 100 req/5min
@@ -28,6 +41,11 @@ class HypixelAPI:
         self.session.headers.update({
             'User-Agent': 'Sky-Port/1.0.0 (Hypixel SkyBlock Profile Exporter)'
         })
+        # (endpoint, params) -> (validator headers, parsed body) for conditional requests,
+        # least recently used first
+        self._conditional_cache: "OrderedDict[Tuple, Tuple[Dict[str, str], Dict[str, Any]]]" = OrderedDict()
+        # Sessions fetch concurrently through the shared client
+        self._conditional_lock = threading.Lock()
     
     def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make a rate-limited request to the Hypixel API"""
@@ -37,17 +55,29 @@ class HypixelAPI:
         if params is None:
             params = {}
         
+        cache_key = (endpoint, tuple(sorted(params.items())))
+        with self._conditional_lock:
+            cached = self._conditional_cache.get(cache_key)
+        
         params['key'] = self.api_key
         
         try:
             response = self.session.get(
                 f"{self.BASE_URL}{endpoint}",
                 params=params,
+                headers=cached[0] if cached else None,
                 timeout=30
             )
             
             self.rate_limiter.record_request()
             
+            # Unchanged since the last fetch - reuse the parsed body
+            if response.status_code == 304 and cached:
+                with self._conditional_lock:
+                    if cache_key in self._conditional_cache:
+                        self._conditional_cache.move_to_end(cache_key)
+                return cached[1]
+            
             if response.status_code == 403:
                 raise InvalidAPIKeyError("Invalid API key or access denied.")
             elif response.status_code == 429:
@@ -56,8 +86,15 @@ class HypixelAPI:
             # Raise an exception for any other bad status codes (4xx or 5xx)
             response.raise_for_status()
 
-            data = response.json()
+            if ORJSON_AVAILABLE:
+                try:
+                    data = orjson.loads(response.content)
+                except orjson.JSONDecodeError as e:
+                    raise HypixelAPIError(f"Invalid JSON in API response: {str(e)}") from e
+            else:
+                data = response.json()
             if data.get('success'):
+                self._remember_validators(cache_key, response, data)
                 return data
             else:
                 raise HypixelAPIError(f"API Error: {data.get('cause', 'Unknown error')}")
@@ -65,6 +102,23 @@ class HypixelAPI:
         except requests.exceptions.RequestException as e:
             raise HypixelAPIError(f"Request failed: {str(e)}") from e
     
+    def _remember_validators(self, cache_key: Tuple, response: requests.Response, data: Dict[str, Any]) -> None:
+        """Store ETag/Last-Modified so the next fetch can be answered with 304"""
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        
+        with self._conditional_lock:
+            if validators:
+                self._conditional_cache[cache_key] = (validators, data)
+                self._conditional_cache.move_to_end(cache_key)
+                while len(self._conditional_cache) > self.CONDITIONAL_CACHE_SIZE:
+                    self._conditional_cache.popitem(last=False)
+            else:
+                self._conditional_cache.pop(cache_key, None)
+    
     def test_api_key(self) -> bool:
         """Test if the API key is valid"""
         try:
@@ -73,42 +73,35 @@ class CSVExporter:
     
     def create_combined_csv(self) -> str:
         """Create a single CSV file with all data sections"""
-        combined_data = []
+        output = io.StringIO()
+        
+        def write_rows(rows):
+            # Convert all values to strings and handle None/NaN values
+            for row in rows:
+                output.write(','.join(str(val) if val is not None else '' for val in row) + '\n')
         
         # Add metadata
-        combined_data.extend([
+        write_rows([
             ['# Sky-Port Combined Export'],
             [f'# Exported: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'],
             ['# All profile data combined'],
             [''],
         ])
         
-        # Process each section
+        # Process each section, writing rows straight to the output
         for section_name, section_data in self.processed_data.items():
             # Section header
-            combined_data.append([f'## {section_name.upper()} ##'])
-            combined_data.append([''])
+            write_rows([[f'## {section_name.upper()} ##'], ['']])
             
             if 'data' in section_data and section_data['data']:
                 df = pd.DataFrame(section_data['data'])
                 
-                # Convert DataFrame to list of lists
-                header = df.columns.tolist()
-                combined_data.append(header)
-                
-                for _, row in df.iterrows():
-                    combined_data.append(row.tolist())
+                write_rows([df.columns.tolist()])
+                write_rows(df.itertuples(index=False, name=None))
             else:
-                combined_data.append(['No data available for this section'])
+                write_rows([['No data available for this section']])
             
-            combined_data.append([''])  # Empty row between sections
-        
-        # Convert to CSV string
-        output = io.StringIO()
-        for row in combined_data:
-            # Convert all values to strings and handle None/NaN values
-            str_row = [str(val) if val is not None else '' for val in row]
-            output.write(','.join(str_row) + '\n')
+            write_rows([['']])  # Empty row between sections
         
         return output.getvalue()
     
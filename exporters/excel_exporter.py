@@ -8,11 +8,12 @@ class ExcelExporter:
     
     def __init__(self, processed_data: Dict[str, Any]):
         self.processed_data = processed_data
-        self.workbook_buffer = io.BytesIO()
     
     def create_workbook(self) -> bytes:
         """Create a comprehensive Excel workbook with all data sheets"""
-        with pd.ExcelWriter(self.workbook_buffer, engine='xlsxwriter') as writer:
+        # Per-call buffer, released as soon as its bytes are returned
+        workbook_buffer = io.BytesIO()
+        with pd.ExcelWriter(workbook_buffer, engine='xlsxwriter') as writer:
             workbook = writer.book
             
             # Define formats
@@ -39,8 +40,7 @@ class ExcelExporter:
             self._create_networth_sheet(writer, header_format, number_format)
             self._create_summary_sheet(writer, header_format, number_format)
         
-        self.workbook_buffer.seek(0)
-        return self.workbook_buffer.getvalue()
+        return workbook_buffer.getvalue()
     
     def _create_profile_overview_sheet(self, writer, header_format, date_format):
         """Create profile overview sheet"""
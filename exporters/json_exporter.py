@@ -1,7 +1,32 @@
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
+# Try to import orjson for faster serialization, but handle the case where it's not available
+ORJSON_AVAILABLE = False
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+
+def _dumps(data: Any, indent: Optional[int] = 2, ensure_ascii: bool = False) -> str:
+    """Serialize to a JSON string, using orjson for the formats it supports.
+
+    orjson writes NaN/Infinity as null where the stdlib writes NaN; data orjson
+    rejects (non-str dict keys, ints wider than 64 bits) goes through json.dumps.
+    """
+    if ORJSON_AVAILABLE and indent in (None, 2) and not ensure_ascii:
+        # Datetimes pass through to default=str to match the stdlib output
+        option = orjson.OPT_PASSTHROUGH_DATETIME
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option).decode('utf-8')
+        except (TypeError, orjson.JSONEncodeError):
+            pass
+    return json.dumps(data, indent=indent, ensure_ascii=ensure_ascii, default=str)
+
 class JSONExporter:
     """Export processed SkyBlock data to JSON format"""
     
@@ -22,7 +47,7 @@ class JSONExporter:
         # Add summary statistics
         export_data['summary'] = self._generate_summary()
         
-        return json.dumps(export_data, indent=indent, ensure_ascii=ensure_ascii, default=str)
+        return _dumps(export_data, indent=indent, ensure_ascii=ensure_ascii)
     
     def create_section_export(self, section: str, indent: int = 2) -> str:
         """Create a JSON export for a specific data section"""
@@ -42,7 +67,8 @@ class JSONExporter:
             'data': self.processed_data[section]
         }
         
-        return json.dumps(section_data, indent=indent, ensure_ascii=False, default=str)
+        # Serialize only this slice directly
+        return _dumps(section_data, indent=indent)
     
     def create_minimal_export(self) -> str:
         """Create a minimal JSON export with only essential data"""
@@ -198,9 +224,9 @@ class JSONExporter:
                         'average_level': sum(skill_levels) / len(skill_levels),
                         'highest_level': max(skill_levels),
                         'lowest_level': min(skill_levels),
-                        'levels_above_30': len([l for l in skill_levels if l >= 30]),
-                        'levels_above_40': len([l for l in skill_levels if l >= 40]),
-                        'levels_above_50': len([l for l in skill_levels if l >= 50])
+                        'levels_above_30': sum(1 for l in skill_levels if l >= 30),
+                        'levels_above_40': sum(1 for l in skill_levels if l >= 40),
+                        'levels_above_50': sum(1 for l in skill_levels if l >= 50)
                     }
         
         # Slayers metrics
@@ -211,8 +237,8 @@ class JSONExporter:
                 metrics['slayers_analysis'] = {
                     'average_level': sum(slayer_levels) / len(slayer_levels) if slayer_levels else 0,
                     'highest_level': max(slayer_levels) if slayer_levels else 0,
-                    'total_xp': sum([slayer.get('xp', 0) for slayer in slayers_data]),
-                    'maxed_slayers': len([l for l in slayer_levels if l >= 9])
+                    'total_xp': sum(slayer.get('xp', 0) for slayer in slayers_data),
+                    'maxed_slayers': sum(1 for l in slayer_levels if l >= 9)
                 }
         
         # Collections metrics
@@ -223,8 +249,8 @@ class JSONExporter:
                 metrics['collections_analysis'] = {
                     'average_tier': sum(collection_tiers) / len(collection_tiers) if collection_tiers else 0,
                     'highest_tier': max(collection_tiers) if collection_tiers else 0,
-                    'total_items': sum([coll.get('amount', 0) for coll in collections_data]),
-                    'maxed_collections': len([t for t in collection_tiers if t >= 10])
+                    'total_items': sum(coll.get('amount', 0) for coll in collections_data),
+                    'maxed_collections': sum(1 for t in collection_tiers if t >= 10)
                 }
         
         return metrics
\ No newline at end of file
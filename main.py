@@ -1,29 +1,31 @@
 import streamlit as st
-import asyncio
+import functools
+import hashlib
+import importlib
+import json
+import logging
+import re
+import threading
 import time
-import traceback
-from typing import Dict, Any, Optional, Tuple
-import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 # Core imports - Fixed paths
 from api.hypixel import HypixelAPI, HypixelAPIError, RateLimitError, InvalidAPIKeyError
 from api.mojang import MojangAPI, MojangAPIError, PlayerNotFoundError
-from processors.profile_processor import ProfileProcessor
-from exporters.excel_exporter import ExcelExporter
-from exporters.json_exporter import JSONExporter
-from exporters.csv_exporter import CSVExporter
-from exporters.pdf_exporter import PDFExporter
-
-# Fixed API integrations - Now properly imported
-from api.skyhelper_networth import SkyHelperNetworth
-from api.elite_farming import EliteFarmingWeight
-from api.neu_repository import NEURepository
-from utils.cache import CacheManager
-from utils.rate_limiter import RateLimiter
-
-# Rest of the existing code remains the same...
-# Custom CSS with enhanced styling
-st.markdown("""
+from utils.cache import StreamlitCache
+
+# Tracebacks go through logging, so they're only formatted when a handler emits them
+logger = logging.getLogger(__name__)
+
+def _minify_css(css: str) -> str:
+    """Collapse whitespace in a style block so fewer bytes are sent on every rerun"""
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{};,>])\s*', r'\1', css).strip()
+
+# Custom CSS with enhanced styling, minified once at import and injected at the top of main()
+_CSS = _minify_css("""
 <style>
     .main-header {
         font-size: 3rem;
@@ -104,26 +106,309 @@ st.markdown("""
         min-width: 120px;
     }
 </style>
-""", unsafe_allow_html=True)
+""")
+
+# Fixed page header, sent as a single markdown element
+_HEADER_HTML = (
+    '<h1 class="main-header">🚀 Sky-Port</h1>\n'
+    '<p style="text-align: center; font-size: 1.2rem; color: #666;">Comprehensive Hypixel SkyBlock Profile Exporter</p>'
+)
+
+# Dashed or undashed player UUID, so Mojang can be skipped for UUID input
+_UUID_RE = re.compile(r'^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$')
+
+# Profile card markup, filled per profile with str.format_map
+_CARD_TMPL = """
+        <div class="profile-card">
+            <div class="profile-name">{profile_name}</div>
+            <div><strong>Mode:</strong> {game_mode}</div>
+            <div><strong>Members:</strong> {members_count}</div>
+            <div class="profile-stats">
+                <div class="stat-item">
+                    <div class="stat-value">{fairy_souls}</div>
+                    <div class="stat-label">Fairy Souls</div>
+                </div>
+            </div>
+        </div>
+        """
+
+# Profile summary metrics as (label, profile_info key, default)
+PROFILE_METRICS = [
+    ("Game Mode", 'game_mode', 'Unknown'),
+    ("Fairy Souls", 'fairy_souls', 0),
+    ("Last Save", 'last_save', 'Unknown'),
+]
+
+# Export formats - exporters are given as 'module:Class' paths and only
+# imported the first time a download is requested
+EXPORT_FORMATS = {
+    'excel': {
+        'name': "Excel",
+        'button_label': "📊 Excel",
+        'exporter': 'exporters.excel_exporter:ExcelExporter',
+        'method': 'create_workbook',
+        'extension': 'xlsx',
+        'mime': "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    },
+    'json': {
+        'name': "JSON",
+        'button_label': "🔧 JSON",
+        'exporter': 'exporters.json_exporter:JSONExporter',
+        'method': 'create_export',
+        'extension': 'json',
+        'mime': "application/json",
+    },
+    'csv': {
+        'name': "CSV",
+        'button_label': "📈 CSV",
+        'exporter': 'exporters.csv_exporter:CSVExporter',
+        'method': 'create_combined_csv',
+        'extension': 'csv',
+        'mime': "text/csv",
+    },
+    'pdf': {
+        'name': "PDF",
+        'button_label': "📄 PDF",
+        'exporter': 'exporters.pdf_exporter:PDFExporter',
+        'method': 'create_report',
+        'extension': 'pdf',
+        'mime': "application/pdf",
+    },
+}
+
+_exporter_classes = {}
+
+def load_exporter(path: str):
+    """Resolve a 'module:Class' exporter path, importing the module on first use"""
+    exporter_class = _exporter_classes.get(path)
+    if exporter_class is None:
+        module_name, class_name = path.split(':')
+        exporter_class = getattr(importlib.import_module(module_name), class_name)
+        _exporter_classes[path] = exporter_class
+    return exporter_class
+
+def hash_api_key(api_key: str) -> str:
+    """Stable digest of the API key, used in cache keys instead of the raw key"""
+    return hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+
+@StreamlitCache.cache_resource()
+def get_hypixel_client(key_hash: str, _api_key: str) -> HypixelAPI:
+    """Shared Hypixel client per API key, so its session and rate limiter survive reruns"""
+    return HypixelAPI(_api_key)
+
+@StreamlitCache.cache_resource()
+def get_mojang_client() -> MojangAPI:
+    """Shared Mojang client, so its HTTP session survives reruns"""
+    return MojangAPI()
+
+@StreamlitCache.cache_static_data()
+def cached_get_uuid(username: str) -> Optional[Dict[str, Any]]:
+    """Resolve a username to its UUID; the mapping rarely changes so it is kept for a day"""
+    return get_mojang_client().get_uuid(username)
+
+@StreamlitCache.cache_api_response(ttl=300)
+def cached_get_player(key_hash: str, uuid: str, _api_key: str) -> Optional[Dict[str, Any]]:
+    """Fetch a player's Hypixel data, reused for 5 minutes"""
+    return get_hypixel_client(key_hash, _api_key).get_player(uuid)
+
+@StreamlitCache.cache_api_response(ttl=300)
+def cached_get_skyblock_profiles(key_hash: str, uuid: str, _api_key: str) -> Optional[Dict[str, Any]]:
+    """Fetch a player's SkyBlock profiles, reused for 5 minutes"""
+    return get_hypixel_client(key_hash, _api_key).get_skyblock_profiles(uuid)
+
+def fetch_player_and_profiles(api_key: str, uuid: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """Fetch player data and SkyBlock profiles concurrently, since both only need the UUID.
+
+    Caches are keyed on a hash of the API key; the raw key is passed unhashed.
+    """
+    key_hash = hash_api_key(api_key)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        player_future = executor.submit(cached_get_player, key_hash, uuid, api_key)
+        profiles_future = executor.submit(cached_get_skyblock_profiles, key_hash, uuid, api_key)
+        return player_future.result(), profiles_future.result()
+
+# (profile_id, save version, player_uuid): identifies one processed profile
+ProcessedKey = Tuple[str, Union[int, str], str]
+
+def profile_version(profile_data: Dict[str, Any], member_data: Dict[str, Any]) -> Union[int, str]:
+    """last_save when the API provides it, otherwise a digest of the member data.
+
+    A missing last_save must not collapse to a constant, or the processed
+    result would be reused for the whole cache TTL even after a Refresh.
+    """
+    last_save = profile_data.get('last_save') or member_data.get('last_save')
+    if last_save:
+        return last_save
+    payload = json.dumps(member_data, sort_keys=True, default=str).encode('utf-8')
+    return f"sha256:{hashlib.sha256(payload).hexdigest()}"
+
+@StreamlitCache.cache_profile_data()
+def process_profile(profile_id: str, last_save: Union[int, str], player_uuid: str,
+                    _member_data: Dict[str, Any], _profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the profile processor, memoized on (profile_id, last_save, player_uuid).
+
+    The underscore-prefixed dicts are not hashed by Streamlit; last_save (see
+    profile_version()) changes whenever the profile does, so the key alone
+    identifies the result.
+    """
+    # Pulls in pandas and the integrations, so only imported once a profile is processed
+    from processors.profile_processor import ProfileProcessor
+    
+    return ProfileProcessor(_member_data, _profile_data).process_all_data()
+
+# Lifetime of built exports, and of recorded export failures
+EXPORT_CACHE_TTL = 600
+
+@st.cache_data(ttl=EXPORT_CACHE_TTL, max_entries=16, show_spinner=False)
+def build_export(processed_key: ProcessedKey, export_format: str,
+                 _processed_data: Dict[str, Any]) -> bytes:
+    """Run the exporter for a format and return the file contents as bytes.
+
+    Cached per (processed_key, export_format); processed_key is the same
+    (profile_id, last_save, player_uuid) key process_profile() is memoized on.
+    """
+    spec = EXPORT_FORMATS[export_format]
+    exporter = load_exporter(spec['exporter'])(_processed_data)
+    export_data = getattr(exporter, spec['method'])()
+    # Encode text exports once so the download button is handed ready bytes
+    if isinstance(export_data, str):
+        export_data = export_data.encode('utf-8')
+    return export_data
+
+@StreamlitCache.cache_resource(ttl=None)
+def get_export_executor() -> ThreadPoolExecutor:
+    """Process-wide pool used to build exports in the background"""
+    return ThreadPoolExecutor(max_workers=len(EXPORT_FORMATS), thread_name_prefix="sky-port-export")
+
+# (processed_key, export_format) -> (failed_at, message) for builds that raised, oldest
+# first. Entries expire like build_export's, so a transient failure is retried later.
+_EXPORT_FAILURES_MAX = 64
+_export_failures: "OrderedDict[Tuple[ProcessedKey, str], Tuple[float, str]]" = OrderedDict()
+_export_failures_lock = threading.Lock()
+
+def record_export_failure(build_key: Tuple[ProcessedKey, str], exc: BaseException) -> None:
+    """Remember that building an export failed, evicting the oldest records past the bound"""
+    with _export_failures_lock:
+        _export_failures[build_key] = (time.monotonic(), str(exc))
+        _export_failures.move_to_end(build_key)
+        while len(_export_failures) > _EXPORT_FAILURES_MAX:
+            _export_failures.popitem(last=False)
+
+def get_export_failure(build_key: Tuple[ProcessedKey, str]) -> Optional[str]:
+    """Error message of a recent failed build of this export, if any"""
+    with _export_failures_lock:
+        record = _export_failures.get(build_key)
+        if record is None:
+            return None
+        if time.monotonic() - record[0] > EXPORT_CACHE_TTL:
+            del _export_failures[build_key]
+            return None
+        return record[1]
+
+def prebuild_exports(processed_key: ProcessedKey, processed_data: Dict[str, Any]) -> None:
+    """Warm the build_export cache for every format without blocking the rerun.
+
+    A download clicked before its build finishes waits on the same cache entry
+    instead of building the file a second time.
+    """
+    executor = get_export_executor()
+    for export_format in EXPORT_FORMATS:
+        build_key = (processed_key, export_format)
+        if get_export_failure(build_key) is not None:
+            continue
+        future = executor.submit(build_export, processed_key, export_format, processed_data)
+        future.add_done_callback(functools.partial(_log_prebuild_failure, build_key))
+
+def export_download_data(processed_key: ProcessedKey, export_format: str,
+                         processed_data: Dict[str, Any]) -> bytes:
+    """Download callable for an export, built when the download is requested.
+
+    Streamlit only reports an opaque media error when this raises, so a failed
+    build is logged, recorded for the next render, and returned as an error text.
+    """
+    try:
+        return build_export(processed_key, export_format, processed_data)
+    except Exception as e:
+        name = EXPORT_FORMATS[export_format]['name']
+        record_export_failure((processed_key, export_format), e)
+        logger.exception("Error exporting to %s", name)
+        return f"Error exporting to {name}: {str(e)}\n".encode('utf-8')
+
+def _log_prebuild_failure(build_key: Tuple[ProcessedKey, str], future) -> None:
+    """Log a failed background export build and record it so it isn't retried right away"""
+    exc = future.exception()
+    if exc is not None:
+        record_export_failure(build_key, exc)
+        logger.error("Background %s export build failed", build_key[1], exc_info=exc)
+
+# Session state defaults, applied once per session
+_DEFAULTS = {
+    'processed_data': None,
+    'player_data': None,
+    'player_uuid': None,
+    'skyblock_profiles': None,
+    'selected_profile': None,
+    'processing_status': None,
+    'export_ready': False,
+    'processed_key': None,
+    'profile_members': None,
+}
 
 # Initialize session state
 def initialize_session_state():
     """Initialize all session state variables"""
-    if 'processed_data' not in st.session_state:
-        st.session_state.processed_data = None
-    if 'player_data' not in st.session_state:
-        st.session_state.player_data = None
-    if 'skyblock_profiles' not in st.session_state:
-        st.session_state.skyblock_profiles = None
-    if 'selected_profile' not in st.session_state:
-        st.session_state.selected_profile = None
-    if 'processing_status' not in st.session_state:
-        st.session_state.processing_status = None
-    if 'export_ready' not in st.session_state:
-        st.session_state.export_ready = False
+    if '_initialized' not in st.session_state:
+        st.session_state.update({**_DEFAULTS, '_initialized': True})
+
+def index_profiles(profiles: List[Dict[str, Any]], player_uuid: Optional[str]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Split fetched profiles into slim card entries and the player's member data.
+
+    Only these are kept in session state, rather than the full profiles JSON
+    with every co-op member's inventories.
+    """
+    profile_index = []
+    profile_members = {}
+    
+    for profile in profiles:
+        # Ensure profile is a dictionary
+        if not isinstance(profile, dict):
+            continue
+        
+        members = profile.get('members', {})
+        if not isinstance(members, dict):
+            members = {}
+        
+        # Card stats come from the player's own member entry, falling back to the first member
+        player_member = members.get(player_uuid)
+        card_member = player_member or next(iter(members.values()), None)
+        fairy_souls = card_member.get('fairy_souls_collected', 0) if isinstance(card_member, dict) else 0
+        
+        entry = {key: value for key, value in profile.items() if key != 'members'}
+        entry['members_count'] = len(members)
+        entry['fairy_souls'] = fairy_souls
+        profile_index.append(entry)
+        profile_members[profile.get('profile_id')] = player_member
+    
+    return profile_index, profile_members
+
+@StreamlitCache.cache_static_data()
+def render_profile_columns(cards: Tuple[Tuple[str, str, int, int], ...], n_cols: int = 2) -> List[str]:
+    """Build the card HTML for each column once per distinct set of profiles"""
+    col_html = [[] for _ in range(n_cols)]
+    
+    for i, (profile_name, game_mode, members_count, fairy_souls) in enumerate(cards):
+        col_html[i % n_cols].append(_CARD_TMPL.format_map({
+            'profile_name': profile_name,
+            'game_mode': game_mode.title(),
+            'members_count': members_count,
+            'fairy_souls': fairy_souls,
+        }))
+    
+    return ["\n".join(parts) for parts in col_html]
 
 def display_profiles(profiles):
     """Display the fetched profiles in a user-friendly format"""
+    ss = st.session_state
     st.markdown("## 📋 SkyBlock Profiles")
     
     if not profiles:
@@ -136,105 +421,86 @@ def display_profiles(profiles):
         return
     
     cols = st.columns(2)
-    
-    for i, profile in enumerate(profiles):
-        # Ensure profile is a dictionary
-        if not isinstance(profile, dict):
+
+    # Hashable card fields, so the HTML is only rebuilt when the profiles change
+    cards = tuple(
+        (profile.get('cute_name', 'Unknown'), profile.get('game_mode', 'normal'),
+         profile.get('members_count', 0), profile.get('fairy_souls', 0))
+        for profile in profiles
+    )
+    col_html = render_profile_columns(cards, len(cols))
+
+    for col_idx, (col, html) in enumerate(zip(cols, col_html)):
+        if not html:
             continue
-            
-        with cols[i % 2]:
-            profile_name = profile.get('cute_name', 'Unknown')
-            game_mode = profile.get('game_mode', 'normal')
-            members = profile.get('members', {})
-            members_count = len(members) if isinstance(members, dict) else 0
-            
-            # Get the first member's data for basic stats
-            fairy_souls = 0
-            first_member_data = {}
-            
-            if isinstance(members, dict) and members:
-                # Get the first member's UUID and data
-                first_member_uuid = list(members.keys())[0]
-                first_member_data = members.get(first_member_uuid, {})
-                # Correct way to get fairy souls - it's in the player's profile data, not members
-                fairy_souls = first_member_data.get('fairy_souls_collected', 0) if isinstance(first_member_data, dict) else 0
-            
-            with st.container():
-                st.markdown(f"""
-                <div class="profile-card">
-                    <div class="profile-name">{profile_name}</div>
-                    <div><strong>Mode:</strong> {game_mode.title()}</div>
-                    <div><strong>Members:</strong> {members_count}</div>
-                    <div class="profile-stats">
-                        <div class="stat-item">
-                            <div class="stat-value">{fairy_souls}</div>
-                            <div class="stat-label">Fairy Souls</div>
-                        </div>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
+
+        with col:
+            st.markdown(html, unsafe_allow_html=True)
+
+            # Buttons stay separate widgets since they carry state
+            for i in range(col_idx, len(profiles), len(cols)):
+                profile = profiles[i]
+                profile_name = cards[i][0]
                 # Use a unique key for each button
                 button_key = f"process_{profile.get('profile_id', f'profile_{i}')}"
                 if st.button(f"Process {profile_name}", key=button_key):
-                    st.session_state.selected_profile = profile
-                    st.session_state.processing_status = "processing"
+                    ss.selected_profile = profile
+                    ss.processing_status = "processing"
                     st.rerun()
 
 def process_selected_profile():
     """Process the selected profile and display results"""
-    if st.session_state.selected_profile and st.session_state.processing_status == "processing":
+    ss = st.session_state
+    selected_profile = ss.selected_profile
+    if selected_profile and ss.processing_status == "processing":
         st.markdown("## 🔄 Processing Profile")
 
         with st.spinner("Processing profile data..."):
             try:
-                selected_profile = st.session_state.selected_profile
-                player_data = st.session_state.player_data # Use the full player data object
+                player_data = ss.player_data # Use the full player data object
                 
                 if not isinstance(selected_profile, dict) or not isinstance(player_data, dict):
                     st.error("❌ Error: Profile or player data is not in the expected format.")
-                    st.session_state.processing_status = None
+                    ss.processing_status = None
                     return
 
-                # Find the specific profile data from the list of profiles
+                # The selected entry already holds the profile-level fields
                 profile_id = selected_profile.get('profile_id')
-                profile_data = next((p for p in st.session_state.skyblock_profiles if p.get('profile_id') == profile_id), None)
-
-                if not profile_data:
-                    st.error("❌ Error: Could not find the selected profile data.")
-                    st.session_state.processing_status = None
-                    return
+                profile_data = selected_profile
                 
-                # The actual member data for the player is inside the 'members' dict of the profile
-                player_uuid = player_data.get('player', {}).get('uuid')
-                member_data = profile_data.get('members', {}).get(player_uuid)
+                # The player's own member data was kept aside per profile at fetch time
+                player_uuid = ss.player_uuid
+                member_data = (ss.profile_members or {}).get(profile_id)
 
                 if not member_data:
                     st.error("❌ Error: Could not find member data for this profile.")
-                    st.session_state.processing_status = None
+                    ss.processing_status = None
                     return
 
-                # Initialize the processor with the correct data
-                processor = ProfileProcessor(member_data, profile_data)
-                processed_data = processor.process_all_data()
+                # Process with the correct data, reusing any earlier result for this save
+                last_save = profile_version(profile_data, member_data)
+                processed_data = process_profile(profile_id, last_save, player_uuid, member_data, profile_data)
                 
-                st.session_state.processed_data = processed_data
-                st.session_state.processing_status = "completed"
+                processed_key = (profile_id, last_save, player_uuid)
+                ss.processed_data = processed_data
+                ss.processed_key = processed_key
+                ss.processing_status = "completed"
+                prebuild_exports(processed_key, processed_data)
                 
                 st.success(f"✅ Profile '{selected_profile.get('cute_name', 'Unknown')}' processed successfully!")
                 
             except Exception as e:
                 st.error(f"❌ Error processing profile: {str(e)}")
-                st.session_state.processing_status = None
-                traceback.print_exc()
+                ss.processing_status = None
+                logger.exception("Error processing profile")
 
 def display_processed_data():
     """Display processed profile data"""
-    if st.session_state.processed_data and st.session_state.processing_status == "completed":
+    ss = st.session_state
+    processed_data = ss.processed_data
+    if processed_data and ss.processing_status == "completed":
         st.markdown("## 📊 Processed Profile Data")
         
-        processed_data = st.session_state.processed_data
-        
         # Display profile info
         profile_info = processed_data.get('profile_info', {})
         if profile_info and isinstance(profile_info, dict) and profile_info.get('data'):
@@ -245,137 +511,106 @@ def display_processed_data():
                 # Ensure info is a dictionary
                 if isinstance(info, dict):
                     st.markdown(f"### {info.get('profile_name', 'Unknown Profile')}")
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Game Mode", info.get('game_mode', 'Unknown'))
-                    with col2:
-                        st.metric("Fairy Souls", info.get('fairy_souls', 0))
-                    with col3:
-                        st.metric("Last Save", info.get('last_save', 'Unknown'))
+                    for col, (label, key, default) in zip(st.columns(len(PROFILE_METRICS)), PROFILE_METRICS):
+                        with col:
+                            st.metric(label, info.get(key, default))
 
+@st.fragment
 def display_export_options():
     """Display export options for processed data"""
-    if st.session_state.processed_data and st.session_state.processing_status == "completed":
+    ss = st.session_state
+    processed_data = ss.processed_data
+    if processed_data and ss.processing_status == "completed":
         st.markdown("## 📤 Export Options")
         
         # Ensure processed_data is a dictionary
-        if not isinstance(st.session_state.processed_data, dict):
+        if not isinstance(processed_data, dict):
             st.error("❌ Error: Processed data is not in the expected format.")
             return
         
         with st.container():
             st.markdown('<div class="export-section">', unsafe_allow_html=True)
             st.markdown("### Choose Export Format")
+            profile_name = (ss.selected_profile or {}).get('cute_name', 'profile')
             
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                if st.button("📊 Excel", key="export_excel", use_container_width=True):
-                    try:
-                        exporter = ExcelExporter(st.session_state.processed_data)
-                        excel_data = exporter.create_workbook()
-                        
-                        st.download_button(
-                            label="Download Excel File",
-                            data=excel_data,
-                            file_name=f"skyblock_profile_{st.session_state.selected_profile.get('cute_name', 'profile')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                        )
-                    except Exception as e:
-                        st.error(f"Error exporting to Excel: {str(e)}")
-                        traceback.print_exc()
-            
-            with col2:
-                if st.button("🔧 JSON", key="export_json", use_container_width=True):
-                    try:
-                        exporter = JSONExporter(st.session_state.processed_data)
-                        json_data = exporter.create_export()
-                        
-                        st.download_button(
-                            label="Download JSON File",
-                            data=json_data,
-                            file_name=f"skyblock_profile_{st.session_state.selected_profile.get('cute_name', 'profile')}.json",
-                            mime="application/json"
-                        )
-                    except Exception as e:
-                        st.error(f"Error exporting to JSON: {str(e)}")
-                        traceback.print_exc()
+            cols = st.columns(len(EXPORT_FORMATS))
             
-            with col3:
-                if st.button("📈 CSV", key="export_csv", use_container_width=True):
-                    try:
-                        exporter = CSVExporter(st.session_state.processed_data)
-                        csv_data = exporter.create_combined_csv()
-                        
-                        st.download_button(
-                            label="Download CSV File",
-                            data=csv_data,
-                            file_name=f"skyblock_profile_{st.session_state.selected_profile.get('cute_name', 'profile')}.csv",
-                            mime="text/csv"
-                        )
-                    except Exception as e:
-                        st.error(f"Error exporting to CSV: {str(e)}")
-                        traceback.print_exc()
+            processed_key = ss.processed_key
             
-            with col4:
-                if st.button("📄 PDF", key="export_pdf", use_container_width=True):
-                    try:
-                        exporter = PDFExporter(st.session_state.processed_data)
-                        pdf_data = exporter.create_report()
-                        
-                        st.download_button(
-                            label="Download PDF Report",
-                            data=pdf_data,
-                            file_name=f"skyblock_profile_{st.session_state.selected_profile.get('cute_name', 'profile')}.pdf",
-                            mime="application/pdf"
-                        )
-                    except Exception as e:
-                        st.error(f"Error exporting to PDF: {str(e)}")
-                        traceback.print_exc()
+            for col, (export_format, spec) in zip(cols, EXPORT_FORMATS.items()):
+                with col:
+                    # A build already known to fail is reported instead of offered
+                    failure = get_export_failure((processed_key, export_format))
+                    if failure is not None:
+                        st.error(f"Error exporting to {spec['name']}: {failure}")
+                        continue
+                    
+                    # The exporter only runs once the download is actually requested
+                    # (usually served from the cache prebuild_exports() warmed)
+                    st.download_button(
+                        label=spec['button_label'],
+                        data=functools.partial(export_download_data, processed_key, export_format, processed_data),
+                        file_name=f"skyblock_profile_{profile_name}.{spec['extension']}",
+                        mime=spec['mime'],
+                        key=f"export_{export_format}",
+                        on_click="ignore",
+                        use_container_width=True
+                    )
             
             st.markdown('</div>', unsafe_allow_html=True)
 
 def main():
     """Enhanced main application function"""
     initialize_session_state()
+    ss = st.session_state
     
-    st.markdown('<h1 class="main-header">🚀 Sky-Port</h1>', unsafe_allow_html=True)
-    st.markdown('<p style="text-align: center; font-size: 1.2rem; color: #666;">Comprehensive Hypixel SkyBlock Profile Exporter</p>', unsafe_allow_html=True)
+    st.markdown(_CSS, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
-    with st.expander("🔑 Configuration", expanded=True):
-        api_key = st.text_input(
-            "Hypixel API Key",
-            type="password",
-            help="Get your API key by typing /api new in Hypixel",
-        )
-        if not api_key:
-            st.warning("⚠️ Please enter your Hypixel API key to continue.")
-            st.info("💡 Get your API key by typing `/api new` in Hypixel chat.")
-            return
+    # Inputs only rerun the script when the form is submitted, not per keystroke
+    with st.form("lookup", clear_on_submit=False, border=False):
+        with st.expander("🔑 Configuration", expanded=True):
+            api_key = st.text_input(
+                "Hypixel API Key",
+                type="password",
+                help="Get your API key by typing /api new in Hypixel",
+            )
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            username = st.text_input("🎮 Player Username", placeholder="Enter Minecraft username or UUID...")
+        with col2:
+            st.markdown("<br>", unsafe_allow_html=True)
+            fetch_button = st.form_submit_button("🔍 Fetch Profile", type="primary", use_container_width=True)
+            refresh_button = st.form_submit_button("♻️ Refresh", help="Ignore cached Hypixel data and fetch again", use_container_width=True)
     
-    col1, col2 = st.columns([3, 1])
-    with col1:
-        username = st.text_input("🎮 Player Username", placeholder="Enter Minecraft username...")
-    with col2:
-        st.markdown("<br>", unsafe_allow_html=True)
-        fetch_button = st.button("🔍 Fetch Profile", type="primary", use_container_width=True)
+    if not api_key:
+        st.warning("⚠️ Please enter your Hypixel API key to continue.")
+        st.info("💡 Get your API key by typing `/api new` in Hypixel chat.")
+        return
     
-    if fetch_button and username:
+    if (fetch_button or refresh_button) and username:
         with st.spinner("Fetching player profiles..."):
             # ADD THIS TRY...EXCEPT BLOCK
             try:
-                mojang_client = MojangAPI()
-                hypixel_client = HypixelAPI(api_key)
+                player_input = username.strip()
+                if _UUID_RE.match(player_input):
+                    uuid = player_input.replace('-', '').lower()
+                else:
+                    uuid_data = cached_get_uuid(player_input)
+                    if not uuid_data:
+                        st.error("❌ Player not found!")
+                        return
+                        
+                    uuid = uuid_data['id']
                 
-                uuid_data = mojang_client.get_uuid(username)
-                if not uuid_data:
-                    st.error("❌ Player not found!")
-                    return
-                    
-                uuid = uuid_data['id']
+                if refresh_button:
+                    # Drop only this player's cached responses; other sessions keep theirs
+                    key_hash = hash_api_key(api_key)
+                    cached_get_player.clear(key_hash, uuid, api_key)
+                    cached_get_skyblock_profiles.clear(key_hash, uuid, api_key)
                 
-                player_data = hypixel_client.get_player(uuid)
-                skyblock_data = hypixel_client.get_skyblock_profiles(uuid)
+                player_data, skyblock_data = fetch_player_and_profiles(api_key, uuid)
                 
                 # Ensure skyblock_data is a dictionary and has profiles
                 if not isinstance(skyblock_data, dict) or 'profiles' not in skyblock_data or not skyblock_data['profiles']:
@@ -388,8 +623,9 @@ def main():
                     st.error("❌ SkyBlock profiles data is not in the expected format.")
                     return
                 
-                st.session_state.player_data = player_data
-                st.session_state.skyblock_profiles = profiles
+                ss.player_data = player_data
+                ss.player_uuid = uuid
+                ss.skyblock_profiles, ss.profile_members = index_profiles(profiles, uuid)
                 st.success("✅ Profiles fetched successfully!")
 
             # CATCH THE SPECIFIC ERRORS
@@ -398,12 +634,13 @@ def main():
                 return
             except Exception as e:
                 st.error(f"❌ An unexpected error occurred: {str(e)}")
-                traceback.print_exc() # For debugging
+                logger.exception("Unexpected error while fetching profiles")
                 return
     
     # Display profiles if they've been fetched
-    if st.session_state.skyblock_profiles:
-        display_profiles(st.session_state.skyblock_profiles)
+    skyblock_profiles = ss.skyblock_profiles
+    if skyblock_profiles:
+        display_profiles(skyblock_profiles)
     
     # Process selected profile if needed
     process_selected_profile()
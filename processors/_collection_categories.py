@@ -0,0 +1,11 @@
+# processors/_collection_categories.py
+# Shared collection category table for the profile and collections processors
+
+# Category -> collection item IDs
+COLLECTION_CATEGORIES = {
+    'FARMING': ['WHEAT', 'CARROT', 'POTATO', 'PUMPKIN', 'SUGAR_CANE', 'MELON', 'SEEDS', 'MUSHROOM_COLLECTION', 'COCOA', 'CACTUS', 'NETHER_STALK'],
+    'MINING': ['COBBLESTONE', 'COAL', 'IRON_INGOT', 'GOLD_INGOT', 'DIAMOND', 'LAPIS_LAZULI', 'EMERALD', 'REDSTONE', 'QUARTZ', 'OBSIDIAN', 'GLOWSTONE_DUST', 'GRAVEL', 'ICE', 'NETHERRACK', 'SAND', 'END_STONE'],
+    'COMBAT': ['ROTTEN_FLESH', 'BONE', 'STRING', 'SPIDER_EYE', 'GUNPOWDER', 'ENDER_PEARL', 'GHAST_TEAR', 'SLIME_BALL', 'BLAZE_ROD', 'MAGMA_CREAM'],
+    'FORAGING': ['LOG', 'LOG:1', 'LOG:2', 'LOG_2:1'],
+    'FISHING': ['RAW_FISH', 'RAW_FISH:1', 'RAW_FISH:2', 'RAW_FISH:3', 'PRISMARINE_SHARD', 'PRISMARINE_CRYSTALS', 'CLAY_BALL', 'WATER_LILY', 'INK_SACK', 'SPONGE']
+}
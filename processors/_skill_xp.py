@@ -0,0 +1,31 @@
+# processors/_skill_xp.py
+# Shared skill XP table for the profile and skills processors
+import numpy as np
+from typing import Tuple
+
+# Cumulative XP required for each skill level (levels 0-60); sorted, so levels come from searchsorted
+SKILL_XP = (
+    0, 50, 175, 375, 675, 1175, 1925, 2925, 4425, 6425, 9925, 14925, 22425, 32425, 47425, 67425, 97425,
+    147425, 222425, 322425, 522425, 822425, 1222425, 1722425, 2322425, 3022425, 3822425, 4722425, 5722425,
+    6822425, 8022425, 9322425, 10722425, 12222425, 13822425, 15522425, 17322425, 19222425, 21222425,
+    23322425, 25522425, 27822425, 30222425, 32722425, 35322425, 38072425, 40972425, 44072425, 47472425,
+    51172425, 55172425, 59472425, 64072425, 68972425, 74172425, 79672425, 85472425, 91572425, 97972425,
+    104672425, 111672425
+)
+
+SKILL_XP_NP = np.asarray(SKILL_XP, dtype=np.int64)
+MAX_SKILL_LEVEL = len(SKILL_XP) - 1
+
+def skill_progress(xps: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Levels, next-level XP thresholds and percent progress for an array of skill XP.
+
+    Maxed skills report their own threshold as the next one and 100% progress.
+    """
+    levels = np.clip(np.searchsorted(SKILL_XP_NP, xps, side='right') - 1, 0, MAX_SKILL_LEVEL)
+    cur_level_xp = SKILL_XP_NP[levels]
+    next_level_xp = SKILL_XP_NP[np.minimum(levels + 1, MAX_SKILL_LEVEL)]
+    progress = np.where(
+        levels >= MAX_SKILL_LEVEL, 100.0,
+        (xps - cur_level_xp) / np.maximum(next_level_xp - cur_level_xp, 1) * 100
+    )
+    return levels, next_level_xp, progress
@@ -2,6 +2,8 @@
 import pandas as pd
 from typing import Dict, Any
 
+from processors._collection_categories import COLLECTION_CATEGORIES
+
 class CollectionsProcessor:
     """Processes collection data and minion crafting information"""
     
@@ -9,16 +11,28 @@ class CollectionsProcessor:
         self.collection_categories = [
             'FARMING', 'MINING', 'COMBAT', 'FORAGING', 'FISHING'
         ]
+        # Collection item -> category, e.g. 'WHEAT' -> 'Farming'
+        self._category_lookup = {
+            item: category.title()
+            for category, items in COLLECTION_CATEGORIES.items()
+            if category in self.collection_categories
+            for item in items
+        }
     
     def process_collections(self, profile_data: Dict[str, Any]) -> pd.DataFrame:
         """Convert collections data to structured format"""
-        collections_data = []
+        tiers = profile_data.get('unlocked_coll_tiers', [])
+        if not tiers:
+            return pd.DataFrame(columns=['collection', 'tier', 'category', 'amount'])
         
-        if 'unlocked_coll_tiers' in profile_data:
-            for collection in profile_data['unlocked_coll_tiers']:
-                collection_info = self._get_collection_details(
-                    collection, profile_data
-                )
-                collections_data.append(collection_info)
+        # Tier unlocks look like 'WHEAT_7' or 'LOG:1_3'; split on the last underscore
+        parts = pd.Series(tiers, dtype='object').str.rsplit('_', n=1, expand=True).reindex(columns=[0, 1])
+        df = pd.DataFrame({
+            'collection': parts[0],
+            # Nullable integers, so unparsable suffixes stay missing instead of turning the column float
+            'tier': pd.to_numeric(parts[1], errors='coerce').astype('Int64'),
+        })
+        df['category'] = df['collection'].map(self._category_lookup)
+        df['amount'] = df['collection'].map(profile_data.get('collection', {})).fillna(0).astype('int64')
         
-        return pd.DataFrame(collections_data)
+        return df
@@ -1,5 +1,7 @@
 # processors/inventory.py
 import base64
+import gzip
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Any
 import io
@@ -12,80 +14,103 @@ try:
 except ImportError:
     nbtlib = None
 
+GZIP_MAGIC = b'\x1f\x8b'
+
+# Every nbtlib tag derives from Base, so one isinstance check replaces hasattr probing
+_NBT_TAG_TYPES = (nbtlib.tag.Base,) if NBTLIB_AVAILABLE else ()
+
+def _unpack(value: Any) -> Any:
+    """Unwrap an nbtlib tag to its plain Python value"""
+    return value.unpack() if isinstance(value, _NBT_TAG_TYPES) else value
+
+# Column order and dtypes of the per-inventory item frames, given up front
+# so pandas doesn't have to infer them row by row. Count is an NBT Byte and
+# Damage an NBT Short, so they fit int8/int16.
+ITEM_DTYPES = {
+    'id': 'object',
+    'Count': 'int8',
+    'Damage': 'int16',
+    'display_name': 'object',
+}
+
+def _build_items_frame(columns: Dict[str, List[Any]]) -> pd.DataFrame:
+    """Build an item DataFrame from per-column lists with the fixed item dtypes"""
+    data = {}
+    for name, dtype in ITEM_DTYPES.items():
+        values = columns.get(name, [])
+        if dtype != 'object':
+            # Written straight into an unboxed array of the final width
+            values = np.fromiter(values, dtype=dtype, count=len(values))
+        data[name] = values
+    return pd.DataFrame(data, columns=list(ITEM_DTYPES)).astype(ITEM_DTYPES, copy=False)
+
 class InventoryProcessor:
     """Processes inventory data including NBT parsing for items"""
     
-    def __init__(self):
-        self.inventory_types = [
-            'inv_contents', 'ender_chest_contents', 'wardrobe_contents',
-            'equipment_contents', 'talisman_bag', 'potion_bag'
-        ]
+    INVENTORY_TYPES = (
+        'inv_contents', 'ender_chest_contents', 'wardrobe_contents',
+        'equipment_contents', 'talisman_bag', 'potion_bag'
+    )
     
     def process_inventory(self, profile_data: Dict[str, Any]) -> Dict[str, pd.DataFrame]:
         """Process all inventory types and return structured data"""
         inventories = {}
         
-        for inv_type in self.inventory_types:
-            if inv_type in profile_data and profile_data[inv_type].get('data'):
-                inventories[inv_type] = self._decode_inventory_data(
-                    profile_data[inv_type]
-                )
+        for inv_type in self.INVENTORY_TYPES:
+            blob = profile_data.get(inv_type)
+            if not (blob and blob.get('data')):
+                continue
+            inventories[inv_type] = self._decode_inventory_data(blob)
         
         return inventories
     
     def _decode_inventory_data(self, inventory_data: Dict) -> pd.DataFrame:
         """Decode base64 NBT data and extract item information"""
-        items = []
+        # One list per column rather than a dict per item
+        ids, counts, damages, display_names = [], [], [], []
         
         if not NBTLIB_AVAILABLE:
             # Return empty DataFrame if nbtlib is not available
-            return pd.DataFrame(items)
+            return _build_items_frame({})
         
         if 'data' in inventory_data:
             try:
                 # Decode base64 NBT data
                 if nbtlib is not None:
-                    nbt_data = nbtlib.load(io.BytesIO(base64.b64decode(inventory_data['data'])))
+                    decoded = base64.b64decode(inventory_data['data'])
+                    # Hypixel inventories are gzipped NBT; parse straight from the decoded
+                    # buffer (BytesIO shares it) rather than through nbtlib.load, which
+                    # expects a file path
+                    stream = io.BytesIO(decoded)
+                    if decoded[:2] == GZIP_MAGIC:
+                        stream = gzip.GzipFile(fileobj=stream)
+                    nbt_data = nbtlib.File.parse(stream)
                     
                     # The actual items are in the 'i' tag
                     for item_tag in nbt_data.get('i', []):
                         # Safely handle nbtlib types
-                        item_id = item_tag.get('id', "")
-                        if hasattr(item_id, 'unpack'):
-                            item_id = str(item_id.unpack())
-                        else:
-                            item_id = str(item_id)
-                            
-                        count = item_tag.get('Count', 0)
-                        if hasattr(count, 'unpack'):
-                            count = int(count.unpack())
-                        else:
-                            count = int(count)
-                            
-                        damage = item_tag.get('Damage', 0)
-                        if hasattr(damage, 'unpack'):
-                            damage = int(damage.unpack())
-                        else:
-                            damage = int(damage)
-
-                        item_details = {
-                            'id': item_id,
-                            'Count': count,
-                            'Damage': damage,
-                        }
+                        item_id = str(_unpack(item_tag.get('id', "")))
                         
                         # Extract custom display name if it exists
+                        display_name = None
                         if 'tag' in item_tag and 'display' in item_tag['tag']:
-                            display_name = item_tag['tag']['display'].get('Name', "")
-                            if hasattr(display_name, 'unpack'):
-                                display_name = str(display_name.unpack())
-                            else:
-                                display_name = str(display_name)
-                            item_details['display_name'] = display_name
+                            display_name = str(_unpack(item_tag['tag']['display'].get('Name', "")))
+                        
+                        # nbtlib numeric tags subclass int, so int() reads them directly
+                        count = int(item_tag.get('Count', 0))
+                        damage = int(item_tag.get('Damage', 0))
                         
-                        items.append(item_details)
+                        ids.append(item_id)
+                        counts.append(count)
+                        damages.append(damage)
+                        display_names.append(display_name)
 
             except Exception as e:
                 print(f"Error decoding inventory data: {e}")
 
-        return pd.DataFrame(items)
\ No newline at end of file
+        return _build_items_frame({
+            'id': ids,
+            'Count': counts,
+            'Damage': damages,
+            'display_name': display_names,
+        })
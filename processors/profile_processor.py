@@ -1,9 +1,11 @@
+import bisect
+import numpy as np
 import pandas as pd
 import json
 import base64
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import math
 import logging
 
 # Fixed imports
@@ -11,19 +13,26 @@ from api.skyhelper_networth import SkyHelperNetworth
 from api.elite_farming import EliteFarmingWeight
 from api.neu_repository import NEURepository
 from processors.inventory import InventoryProcessor # Import the inventory processor
+from processors._skill_xp import SKILL_XP, skill_progress
+from processors._collection_categories import COLLECTION_CATEGORIES
+
+# Cosmetic skills left out of the skill average
+_NON_AVG_SKILLS = frozenset(('social', 'carpentry', 'runecrafting'))
+
+# Cumulative XP required for each slayer level (levels 0-9)
+SLAYER_XP = (0, 5, 15, 200, 1000, 5000, 20000, 100000, 400000, 1000000)
 
 class ProfileProcessor:
     """Enhanced profile processor with all integrations"""
     
     # XP requirements for skills (levels 0-60)
-    SKILL_XP = [
-        0, 50, 175, 375, 675, 1175, 1925, 2925, 4425, 6425, 9925, 14925, 22425, 32425, 47425, 67425, 97425,
-        147425, 222425, 322425, 522425, 822425, 1222425, 1722425, 2322425, 3022425, 3822425, 4722425, 5722425,
-        6822425, 8022425, 9322425, 10722425, 12222425, 13822425, 15522425, 17322425, 19222425, 21222425,
-        23322425, 25522425, 27822425, 30222425, 32722425, 35322425, 38072425, 40972425, 44072425, 47472425,
-        51172425, 55172425, 59472425, 64072425, 68972425, 74172425, 79672425, 85472425, 91572425, 97972425,
-        104672425, 111672425
-    ]
+    SKILL_XP = SKILL_XP
+    
+    # Skills in export order, with their member-data keys and display titles built once
+    SKILLS = ('farming', 'mining', 'combat', 'foraging', 'fishing', 'enchanting', 'alchemy', 'carpentry', 'runecrafting', 'taming', 'social')
+    SKILL_API_KEYS = tuple(f'experience_skill_{skill}' for skill in SKILLS)
+    SKILL_TITLES = tuple(skill.title() for skill in SKILLS)
+    COUNTED_SKILLS = sum(1 for skill in SKILLS if skill not in _NON_AVG_SKILLS)
     
     # Slayer boss types
     SLAYERS = {
@@ -34,50 +43,126 @@ class ProfileProcessor:
         'blaze': 'Inferno Demonlord'
     }
     
+    # Member-data keys for boss kills at tiers 1-5 (stored zero-based)
+    SLAYER_KILL_KEYS = tuple(f'boss_kills_tier_{i}' for i in range(5))
+    
     # Collection categories
-    COLLECTION_CATEGORIES = {
-        'FARMING': ['WHEAT', 'CARROT', 'POTATO', 'PUMPKIN', 'SUGAR_CANE', 'MELON', 'SEEDS', 'MUSHROOM_COLLECTION', 'COCOA', 'CACTUS', 'NETHER_STALK'],
-        'MINING': ['COBBLESTONE', 'COAL', 'IRON_INGOT', 'GOLD_INGOT', 'DIAMOND', 'LAPIS_LAZULI', 'EMERALD', 'REDSTONE', 'QUARTZ', 'OBSIDIAN', 'GLOWSTONE_DUST', 'GRAVEL', 'ICE', 'NETHERRACK', 'SAND', 'END_STONE'],
-        'COMBAT': ['ROTTEN_FLESH', 'BONE', 'STRING', 'SPIDER_EYE', 'GUNPOWDER', 'ENDER_PEARL', 'GHAST_TEAR', 'SLIME_BALL', 'BLAZE_ROD', 'MAGMA_CREAM'],
-        'FORAGING': ['LOG', 'LOG:1', 'LOG:2', 'LOG_2:1'],
-        'FISHING': ['RAW_FISH', 'RAW_FISH:1', 'RAW_FISH:2', 'RAW_FISH:3', 'PRISMARINE_SHARD', 'PRISMARINE_CRYSTALS', 'CLAY_BALL', 'WATER_LILY', 'INK_SACK', 'SPONGE']
+    COLLECTION_CATEGORIES = COLLECTION_CATEGORIES
+    
+    # Flattened once at class load: item -> category title and item -> display name
+    _ITEM_TO_CATEGORY = {
+        item: category.title()
+        for category, items in COLLECTION_CATEGORIES.items()
+        for item in items
     }
+    _ITEM_DISPLAY = {item: item.replace('_', ' ').title() for item in _ITEM_TO_CATEGORY}
+
+    # Section name -> builder method, in export order
+    SECTIONS = {
+        'profile_info': '_process_profile_info',
+        'skills': '_process_skills',
+        'slayers': '_process_slayers',
+        'dungeons': '_process_dungeons',
+        'inventory': '_process_inventory',
+        'collections': '_process_collections',
+        'pets': '_process_pets',
+        'networth': '_process_networth',
+        'misc': '_process_misc_stats',
+        'detailed_networth': '_process_detailed_networth',
+        'farming_weight': '_process_farming_weight',
+    }
+    
+    # Sections backed by the external integrations; independent, so run concurrently
+    INTEGRATION_SECTIONS = ('detailed_networth', 'farming_weight')
+
+    # No per-instance __dict__; the lazily built integrations get their own slots
+    __slots__ = (
+        'member_data', 'profile_data', 'processed_data', 'logger',
+        '_skyhelper', '_elite_farming', '_neu_repo', '_inventory_processor',
+    )
 
     def __init__(self, member_data: Dict[str, Any], profile_data: Dict[str, Any]):
         self.member_data = member_data if isinstance(member_data, dict) else {}
         self.profile_data = profile_data if isinstance(profile_data, dict) else {}
         self.processed_data = {}
         self.logger = logging.getLogger(__name__)
-        
-        # Initialize integrations
-        self.skyhelper = SkyHelperNetworth()
-        self.elite_farming = EliteFarmingWeight()
-        self.neu_repo = NEURepository()
-        self.inventory_processor = InventoryProcessor()
+        self._skyhelper = None
+        self._elite_farming = None
+        self._neu_repo = None
+        self._inventory_processor = None
+
+    # Integrations are built on first use; SkyHelper fetches bazaar prices on construction
+    @property
+    def skyhelper(self) -> SkyHelperNetworth:
+        if self._skyhelper is None:
+            self._skyhelper = SkyHelperNetworth()
+        return self._skyhelper
 
-    def process_all_data(self) -> Dict[str, Any]:
-        """Process all profile data with enhanced calculations"""
+    @property
+    def elite_farming(self) -> EliteFarmingWeight:
+        if self._elite_farming is None:
+            self._elite_farming = EliteFarmingWeight()
+        return self._elite_farming
+
+    @property
+    def neu_repo(self) -> NEURepository:
+        if self._neu_repo is None:
+            self._neu_repo = NEURepository()
+        return self._neu_repo
+
+    @property
+    def inventory_processor(self) -> InventoryProcessor:
+        if self._inventory_processor is None:
+            self._inventory_processor = InventoryProcessor()
+        return self._inventory_processor
+
+    def get_section(self, section: str) -> Dict[str, Any]:
+        """Compute a single section on first access and memoize it"""
+        if section not in self.processed_data:
+            if section not in self.SECTIONS:
+                raise KeyError(f"Unknown section: {section}")
+            self.processed_data[section] = getattr(self, self.SECTIONS[section])()
+        return self.processed_data[section]
+
+    def process_all_data(self, sections: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Process the requested sections (all by default), returned in SECTIONS order"""
+        # Bad section names are a caller error, so they are raised rather than logged
+        if isinstance(sections, str):
+            raise TypeError("sections must be an iterable of section names, not a single string")
+        wanted = set(self.SECTIONS if sections is None else sections)
+        unknown = wanted.difference(self.SECTIONS)
+        if unknown:
+            raise KeyError(f"Unknown section(s): {', '.join(sorted(unknown))}")
+        
         try:
-            self.processed_data = {
-                'profile_info': self._process_profile_info(),
-                'skills': self._process_skills(),
-                'slayers': self._process_slayers(),
-                'dungeons': self._process_dungeons(),
-                'inventory': self.inventory_processor.process_inventory(self.member_data), # Use the processor
-                'collections': self._process_collections(),
-                'pets': self._process_pets(),
-                'networth': self._process_networth(),
-                'misc': self._process_misc_stats(),
-                
-                'detailed_networth': self._safe_calculate_networth(self.member_data),
-                'farming_weight': self._safe_calculate_farming_weight(self.member_data),
-            }
-            return self.processed_data
+            integrations = [section for section in self.INTEGRATION_SECTIONS if section in wanted]
+            with ThreadPoolExecutor(max_workers=max(1, len(integrations))) as executor:
+                futures = [executor.submit(self.get_section, section) for section in integrations]
+                # Local sections are computed while the integrations are in flight
+                for section in self.SECTIONS:
+                    if section in wanted and section not in self.INTEGRATION_SECTIONS:
+                        self.get_section(section)
+                for future in futures:
+                    future.result()
+            
+            return {section: self.processed_data[section] for section in self.SECTIONS if section in wanted}
             
         except Exception as e:
             self.logger.error(f"Error processing profile data: {e}")
             return {}
 
+    def _process_inventory(self) -> Dict[str, Any]:
+        """Process inventory data using the inventory processor"""
+        return self.inventory_processor.process_inventory(self.member_data)
+
+    def _process_detailed_networth(self) -> Dict[str, Any]:
+        """Detailed networth from the SkyHelper integration"""
+        return self._safe_calculate_networth(self.member_data)
+
+    def _process_farming_weight(self) -> Dict[str, Any]:
+        """Farming weight from the Elite Bot integration"""
+        return self._safe_calculate_farming_weight(self.member_data)
+
     def _safe_calculate_networth(self, member_data: Dict[str, Any]) -> Dict[str, Any]:
         """Safely calculate networth with error handling"""
         try:
@@ -97,112 +182,133 @@ class ProfileProcessor:
 
     def _process_profile_info(self) -> Dict[str, Any]:
         """Process basic profile information"""
-        last_save = self.member_data.get('last_save', 0)
+        member_data = self.member_data
+        profile_data = self.profile_data
+        profile_name = profile_data.get('cute_name', 'Unknown')
+        game_mode = profile_data.get('game_mode', 'normal')
+        
+        # Converted once; the export row gets the formatted string, the summary the datetime
+        last_save = member_data.get('last_save', 0)
+        last_active = datetime.fromtimestamp(last_save / 1000) if last_save else None
         
         return {
             'data': [{
-                'profile_name': self.profile_data.get('cute_name', 'Unknown'),
-                'game_mode': self.profile_data.get('game_mode', 'normal'),
-                'last_save': datetime.fromtimestamp(last_save / 1000).strftime('%Y-%m-%d %H:%M:%S') if last_save else 'Unknown',
-                'fairy_souls': self.member_data.get('fairy_souls_collected', 0),
-                'fairy_exchanges': self.member_data.get('fairy_exchanges', 0),
-                'deaths': self.member_data.get('death_count', 0) # Correct field is death_count
+                'profile_name': profile_name,
+                'game_mode': game_mode,
+                'last_save': last_active.strftime('%Y-%m-%d %H:%M:%S') if last_active else 'Unknown',
+                'fairy_souls': member_data.get('fairy_souls_collected', 0),
+                'fairy_exchanges': member_data.get('fairy_exchanges', 0),
+                'deaths': member_data.get('death_count', 0) # Correct field is death_count
             }],
             'summary': {
-                'profile_name': self.profile_data.get('cute_name', 'Unknown'),
-                'game_mode': self.profile_data.get('game_mode', 'normal'),
-                'last_active': datetime.fromtimestamp(last_save / 1000) if last_save else None
+                'profile_name': profile_name,
+                'game_mode': game_mode,
+                'last_active': last_active
             }
         }
     
     def _process_skills(self) -> Dict[str, Any]:
         """Process skills data including levels and XP"""
-        skills_data = []
-        skills = ['farming', 'mining', 'combat', 'foraging', 'fishing', 'enchanting', 'alchemy', 'carpentry', 'runecrafting', 'taming', 'social']
+        member_data = self.member_data
+        xp_values = [member_data.get(key, 0) for key in self.SKILL_API_KEYS]
+        
+        # Levels, next-level thresholds and progress for every skill in one pass
+        levels, next_level_xp, progress = skill_progress(np.asarray(xp_values))
         
+        # Row count is fixed, so the list is sized up front and filled by index
+        skills_data = [None] * len(self.SKILLS)
         total_level = 0
-        counted_skills = 0
+        maxed_skills = 0
         
-        for skill in skills:
-            xp = self.member_data.get(f'experience_skill_{skill.lower()}', 0)
-            level = self._calculate_skill_level(xp)
-            
-            skills_data.append({
-                'skill': skill.title(), 'level': level, 'xp': xp,
-                'xp_to_next': self._xp_to_next_level(xp, level),
-                'progress_percent': self._skill_progress_percent(xp, level)
-            })
+        rows = zip(self.SKILLS, self.SKILL_TITLES, xp_values, levels.tolist(), next_level_xp.tolist(), progress.tolist())
+        for i, (skill, title, xp, level, next_xp, percent) in enumerate(rows):
+            skills_data[i] = {
+                'skill': title, 'level': level, 'xp': xp,
+                # Maxed skills have no next threshold above their XP
+                'xp_to_next': max(next_xp - xp, 0),
+                'progress_percent': percent
+            }
             
-            if skill not in ['social', 'carpentry', 'runecrafting']:
+            if skill not in _NON_AVG_SKILLS:
                 total_level += level
-                counted_skills += 1
+            if level >= 50:
+                maxed_skills += 1
         
-        skill_average = total_level / counted_skills if counted_skills > 0 else 0
+        skill_average = total_level / self.COUNTED_SKILLS
         
         return {
             'data': skills_data, 'average': skill_average,
             'summary': {
-                'skill_average': skill_average, 'total_skills': len(skills),
-                'maxed_skills': len([s for s in skills_data if s['level'] >= 50])
+                'skill_average': skill_average, 'total_skills': len(self.SKILLS),
+                'maxed_skills': maxed_skills
             }
         }
 
     def _process_slayers(self) -> Dict[str, Any]:
         """Process slayer boss data"""
-        slayers_data = []
+        slayers_data = [None] * len(self.SLAYERS)
         slayer_bosses = self.member_data.get('slayer_bosses', {})
+        total_slayer_xp = total_kills = maxed_slayers = 0
         
-        for slayer_type, display_name in self.SLAYERS.items():
+        for i, (slayer_type, display_name) in enumerate(self.SLAYERS.items()):
             slayer_data = slayer_bosses.get(slayer_type, {})
             xp = slayer_data.get('xp', 0)
             
-            boss_kills = {f'tier_{i}': slayer_data.get(f'boss_kills_tier_{i-1}', 0) for i in range(1, 6)}
+            boss_kills = [slayer_data.get(key, 0) for key in self.SLAYER_KILL_KEYS]
+            level = self._calculate_slayer_level(xp)
+            slayer_kills = sum(boss_kills)
 
-            slayers_data.append({
-                'slayer': display_name, 'xp': xp, 'level': self._calculate_slayer_level(xp),
-                'tier_1_kills': boss_kills.get('tier_1', 0),
-                'tier_2_kills': boss_kills.get('tier_2', 0),
-                'tier_3_kills': boss_kills.get('tier_3', 0),
-                'tier_4_kills': boss_kills.get('tier_4', 0),
-                'total_kills': sum(boss_kills.values())
-            })
+            slayers_data[i] = {
+                'slayer': display_name, 'xp': xp, 'level': level,
+                'tier_1_kills': boss_kills[0],
+                'tier_2_kills': boss_kills[1],
+                'tier_3_kills': boss_kills[2],
+                'tier_4_kills': boss_kills[3],
+                'total_kills': slayer_kills
+            }
+            
+            # Summary totals accumulate alongside the rows
+            total_slayer_xp += xp
+            total_kills += slayer_kills
+            if level >= 9:
+                maxed_slayers += 1
         
-        total_slayer_xp = sum(s['xp'] for s in slayers_data)
         return {
             'data': slayers_data,
             'summary': {
                 'total_slayer_xp': total_slayer_xp,
-                'total_kills': sum(s['total_kills'] for s in slayers_data),
-                'maxed_slayers': len([s for s in slayers_data if s['level'] >= 9])
+                'total_kills': total_kills,
+                'maxed_slayers': maxed_slayers
             }
         }
 
     def _process_dungeons(self) -> Dict[str, Any]:
         """Process dungeon data including catacombs and classes"""
         dungeons = self.member_data.get('dungeons', {})
-        dungeon_data = []
+        classes = ['healer', 'mage', 'berserk', 'archer', 'tank']
+        # One Catacombs row followed by one row per class
+        dungeon_data = [None] * (1 + len(classes))
         
         dungeon_types = dungeons.get('dungeon_types', {})
         catacombs = dungeon_types.get('catacombs', {})
         cata_xp = catacombs.get('experience', 0)
         cata_level = self._calculate_dungeon_level(cata_xp)
         
-        dungeon_data.append({
+        dungeon_data[0] = {
             'type': 'Catacombs', 'level': cata_level, 'xp': cata_xp,
             'highest_floor': catacombs.get('highest_tier_completed', 0), 'class': None
-        })
+        }
         
-        classes = ['healer', 'mage', 'berserk', 'archer', 'tank']
         player_classes = dungeons.get('player_classes', {})
-        for class_name in classes:
+        for i, class_name in enumerate(classes, start=1):
             class_info = player_classes.get(class_name, {})
             class_xp = class_info.get('experience', 0)
             class_level = self._calculate_dungeon_level(class_xp)
             
-            dungeon_data.append({
+            dungeon_data[i] = {
                 'type': None, 'level': class_level, 'xp': class_xp,
                 'highest_floor': None, 'class': class_name.title()
-            })
+            }
         
         return {
             'data': dungeon_data,
@@ -216,25 +322,43 @@ class ProfileProcessor:
     def _process_collections(self) -> Dict[str, Any]:
         """Process collection data"""
         collections_data = []
+        maxed_collections = total_items = 0
         unlocked_tiers = self.member_data.get('unlocked_coll_tiers', [])
         collection_xp = self.member_data.get('collection', {})
         
-        for category, items in self.COLLECTION_CATEGORIES.items():
-            for item in items:
-                amount = collection_xp.get(item, 0)
-                max_tier = max([int(t.split('_')[-1]) for t in unlocked_tiers if t.startswith(f'{item}_')], default=0)
-                
-                if amount > 0 or max_tier > 0:
-                    collections_data.append({
-                        'collection': item.replace('_', ' ').title(), 'category': category.title(),
-                        'amount': amount, 'max_tier': max_tier
-                    })
+        # Highest unlocked tier per item, from one pass over the ITEM_TIER strings
+        max_tiers = {}
+        for tier in unlocked_tiers:
+            idx = tier.rfind('_')
+            if idx < 0:
+                continue
+            try:
+                tier_num = int(tier[idx + 1:])
+            except ValueError:
+                continue
+            name = tier[:idx]
+            if tier_num > max_tiers.get(name, -1):
+                max_tiers[name] = tier_num
+        
+        item_display = self._ITEM_DISPLAY
+        for item, category in self._ITEM_TO_CATEGORY.items():
+            amount = collection_xp.get(item, 0)
+            max_tier = max_tiers.get(item, 0)
+            
+            if amount > 0 or max_tier > 0:
+                collections_data.append({
+                    'collection': item_display[item], 'category': category,
+                    'amount': amount, 'max_tier': max_tier
+                })
+                total_items += amount
+                if max_tier >= 10:
+                    maxed_collections += 1
         return {
             'data': collections_data,
             'summary': {
                 'total_collections': len(collections_data),
-                'maxed_collections': len([c for c in collections_data if c['max_tier'] >= 10]),
-                'total_items_collected': sum(c['amount'] for c in collections_data)
+                'maxed_collections': maxed_collections,
+                'total_items_collected': total_items
             }
         }
         
@@ -242,18 +366,27 @@ class ProfileProcessor:
         """Process pets data"""
         pets_data = self.member_data.get('pets', [])
         processed_pets = []
+        legendary_pets = 0
+        active_pet = None
         for pet in pets_data:
+            pet_type = pet.get('type', 'Unknown')
+            tier = pet.get('tier', 'COMMON')
+            active = pet.get('active', False)
             processed_pets.append({
-                'type': pet.get('type', 'Unknown'), 'tier': pet.get('tier', 'COMMON'),
+                'type': pet_type, 'tier': tier,
                 'level': pet.get('level', 1), 'xp': pet.get('exp', 0),
-                'active': pet.get('active', False), 'held_item': pet.get('heldItem', None)
+                'active': active, 'held_item': pet.get('heldItem', None)
             })
+            if tier == 'LEGENDARY':
+                legendary_pets += 1
+            if active and active_pet is None:
+                active_pet = pet_type
         return {
             'data': processed_pets,
             'summary': {
                 'total_pets': len(processed_pets),
-                'legendary_pets': len([p for p in processed_pets if p.get('tier') == 'LEGENDARY']),
-                'active_pet': next((p['type'] for p in processed_pets if p.get('active')), 'None')
+                'legendary_pets': legendary_pets,
+                'active_pet': active_pet if active_pet is not None else 'None'
             }
         }
         
@@ -262,63 +395,35 @@ class ProfileProcessor:
         purse = self.member_data.get('coin_purse', 0)
         banking_data = self.profile_data.get('banking', {})
         bank = banking_data.get('balance', 0) if isinstance(banking_data, dict) else 0
+        total = purse + bank
         return {
-            'data': [{'category': 'Coins', 'purse': purse, 'bank': bank, 'total': purse + bank}],
-            'total': purse + bank,
-            'summary': {'liquid_coins': purse + bank}
+            'data': [{'category': 'Coins', 'purse': purse, 'bank': bank, 'total': total}],
+            'total': total,
+            'summary': {'liquid_coins': total}
         }
         
     def _process_misc_stats(self) -> Dict[str, Any]:
         """Process miscellaneous statistics"""
-        stats = self.member_data.get('stats', {})
-        objectives = self.member_data.get('objectives', {})
+        member_data = self.member_data
+        stats = member_data.get('stats', {})
+        objectives = member_data.get('objectives', {})
         return {
             'data': [{'deaths': stats.get('deaths', 0), 'kills': stats.get('kills', 0), 'items_fished': stats.get('items_fished', 0)}],
             'summary': {
                 'total_objectives': len(objectives),
-                'completed_objectives': len([o for o in objectives.values() if isinstance(o, dict) and o.get('status') == 'COMPLETE'])
+                'completed_objectives': sum(1 for o in objectives.values() if isinstance(o, dict) and o.get('status') == 'COMPLETE')
             }
         }
         
-    def _calculate_skill_level(self, xp: float) -> int:
-        """Calculate skill level from XP"""
-        for level, required_xp in enumerate(self.SKILL_XP):
-            if xp < required_xp:
-                return level - 1
-        return len(self.SKILL_XP) - 1
-    
-    def _xp_to_next_level(self, current_xp: float, current_level: int) -> float:
-        """Calculate XP needed for next level"""
-        if current_level >= len(self.SKILL_XP) - 1:
-            return 0
-        return self.SKILL_XP[current_level + 1] - current_xp
-    
-    def _skill_progress_percent(self, current_xp: float, current_level: int) -> float:
-        """Calculate progress percentage to next level"""
-        if current_level >= len(self.SKILL_XP) - 1:
-            return 100.0
-        
-        current_level_xp = self.SKILL_XP[current_level]
-        next_level_xp = self.SKILL_XP[current_level + 1]
-        progress_xp = current_xp - current_level_xp
-        level_xp_diff = next_level_xp - current_level_xp
-        
-        return (progress_xp / level_xp_diff) * 100 if level_xp_diff > 0 else 0
-    
     def _calculate_slayer_level(self, xp: float) -> int:
         """Calculate slayer level from XP"""
-        slayer_xp_requirements = [0, 5, 15, 200, 1000, 5000, 20000, 100000, 400000, 1000000]
-        
-        for level, required_xp in enumerate(slayer_xp_requirements):
-            if xp < required_xp:
-                return level - 1
-        return len(slayer_xp_requirements) - 1
+        return max(0, bisect.bisect_right(SLAYER_XP, xp) - 1)
     
     def _calculate_dungeon_level(self, xp: float) -> int:
         """Calculate dungeon level from XP"""
-        # Simplified dungeon XP calculation
+        # Simplified dungeon XP calculation: one level per doubling of 50 XP
         if xp < 50: return 0
-        return min(50, int(math.log(xp / 50) / math.log(2)) + 1)
+        return min(50, (int(xp) // 50).bit_length())
         
     def calculate_detailed_networth(self):
         """Calculate networth using SkyHelper integration"""
@@ -1,15 +1,15 @@
 # processors/skills.py
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional
 
+from processors._skill_xp import SKILL_XP, skill_progress
+
 class SkillsProcessor:
     """Processes Hypixel SkyBlock skills data into structured formats"""
     
-    # XP requirements for each skill level (0-60)
-    SKILL_XP_TABLE = {
-        0: 0, 1: 50, 2: 175, 3: 375, 4: 675, 5: 1175,
-        # ... complete XP table
-    }
+    # XP requirements for each skill level (0-60), shared with ProfileProcessor
+    SKILL_XP_TABLE = SKILL_XP
     
     def __init__(self):
         self.skills = [
@@ -20,13 +20,19 @@ class SkillsProcessor:
     
     def process_skills_data(self, profile_data: Dict[str, Any]) -> pd.DataFrame:
         """Convert raw skills data to structured DataFrame"""
-        skills_data = []
+        xps = np.asarray([profile_data.get(f'experience_skill_{skill}', 0) for skill in self.skills])
         
-        for skill in self.skills:
-            skill_data = self._extract_skill_info(profile_data, skill)
-            skills_data.append(skill_data)
+        # Every skill's level and progress from one searchsorted over the XP table
+        levels, next_level_xp, progress = skill_progress(xps)
         
-        return pd.DataFrame(skills_data)
+        return pd.DataFrame({
+            'skill': [skill.title() for skill in self.skills],
+            'level': levels,
+            'xp': xps,
+            # Maxed skills have no next threshold above their XP
+            'xp_to_next': np.maximum(next_level_xp - xps, 0),
+            'progress_percent': progress,
+        })
     
     def calculate_skill_average(self, profile_data: Dict[str, Any]) -> float:
         """Calculate skill average excluding social and carpentry"""
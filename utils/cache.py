@@ -1,90 +1,163 @@
 import time
+import heapq
+import itertools
 import json
 import hashlib
-from typing import Any, Optional, Dict, Callable
+import pickle
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Callable, Hashable, List, Tuple
 import streamlit as st
 from datetime import datetime, timedelta
 
+# Try to import xxhash for faster key hashing, but handle the case where it's not available
+XXHASH_AVAILABLE = False
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+
+# Argument types that cached_function can key on directly, without hashing
+_SCALAR_KEY_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+def _canonical(value: Any) -> Any:
+    """Order-independent form of dicts and sets (recursively) so equal arguments pickle alike"""
+    if isinstance(value, dict):
+        items = ((_canonical(k), _canonical(v)) for k, v in value.items())
+        return (type(value), tuple(sorted(items, key=repr)))
+    if isinstance(value, (set, frozenset)):
+        return (type(value), tuple(sorted((_canonical(v) for v in value), key=repr)))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_canonical(v) for v in value))
+    return value
+
 class CacheManager:
     """Advanced caching system for API responses and processed data"""
     
-    def __init__(self):
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+    __slots__ = ('memory_cache', 'max_entries', 'cache_stats', '_expiry_heap', '_expiry_seq')
+    
+    def __init__(self, max_entries: int = 10_000):
+        # Ordered by recency of use; the least recently used entry is evicted first
+        self.memory_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self.max_entries = max_entries
         self.cache_stats = {
             'hits': 0,
             'misses': 0,
             'evictions': 0
         }
+        # (expires_at, seq, key) min-heap so cleanup only visits entries that have expired;
+        # seq breaks ties so keys of different types are never compared
+        self._expiry_heap: List[Tuple[float, int, Any]] = []
+        self._expiry_seq = itertools.count()
     
     def _generate_cache_key(self, *args, **kwargs) -> str:
         """Generate a unique cache key from arguments"""
-        key_data = {
-            'args': args,
-            'kwargs': sorted(kwargs.items()) if kwargs else None
-        }
-        key_string = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        key_data = _canonical((args, tuple(sorted(kwargs.items())) if kwargs else None))
+        try:
+            payload = pickle.dumps(key_data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Unpicklable arguments fall back to their string form
+            payload = json.dumps(key_data, sort_keys=True, default=str).encode()
+        
+        if XXHASH_AVAILABLE:
+            return xxhash.xxh3_64_hexdigest(payload)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
     
-    def _is_expired(self, cache_entry: Dict[str, Any]) -> bool:
+    def _is_expired(self, cache_entry: Dict[str, Any], now: Optional[float] = None) -> bool:
         """Check if a cache entry has expired"""
-        if 'expires_at' not in cache_entry:
+        expires_at = cache_entry.get('expires_at')
+        if expires_at is None:
             return False
-        return time.time() > cache_entry['expires_at']
+        return (time.time() if now is None else now) > expires_at
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get a value from cache"""
         if key in self.memory_cache:
             entry = self.memory_cache[key]
-            if not self._is_expired(entry):
+            now = time.time()
+            if not self._is_expired(entry, now):
                 self.cache_stats['hits'] += 1
-                entry['last_accessed'] = time.time()
+                entry['last_accessed'] = now
+                self.memory_cache.move_to_end(key)
                 return entry['data']
             else:
                 # Remove expired entry
                 del self.memory_cache[key]
                 self.cache_stats['evictions'] += 1
+                self._compact_expiry_heap()
         
         self.cache_stats['misses'] += 1
         return None
     
-    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+    def set(self, key: Hashable, value: Any, ttl: int = 3600) -> None:
         """Set a value in cache with TTL (time to live) in seconds"""
-        expires_at = time.time() + ttl if ttl > 0 else None
+        now = time.time()
+        expires_at = now + ttl if ttl > 0 else None
+        
+        if key in self.memory_cache:
+            self.memory_cache.move_to_end(key)
+        elif len(self.memory_cache) >= self.max_entries:
+            # LRU eviction; the evicted key's heap record goes stale and is pruned by compaction
+            self.memory_cache.popitem(last=False)
+            self.cache_stats['evictions'] += 1
         
         self.memory_cache[key] = {
             'data': value,
-            'created_at': time.time(),
-            'last_accessed': time.time(),
+            'created_at': now,
+            'last_accessed': now,
             'expires_at': expires_at,
             'ttl': ttl
         }
+        if expires_at is not None:
+            heapq.heappush(self._expiry_heap, (expires_at, next(self._expiry_seq), key))
+        # Keeps the heap within twice max_entries, whatever the TTLs of recent sets
+        self._compact_expiry_heap()
     
-    def delete(self, key: str) -> bool:
+    def _compact_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from live entries once stale records dominate it.
+
+        Overwrites, deletes and evictions leave their old heap records behind;
+        rebuilding at twice the live size keeps the heap bounded at O(1) amortized cost.
+        """
+        if len(self._expiry_heap) <= 2 * len(self.memory_cache):
+            return
+        self._expiry_heap = [
+            (entry['expires_at'], next(self._expiry_seq), key)
+            for key, entry in self.memory_cache.items()
+            if entry['expires_at'] is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+    
+    def delete(self, key: Hashable) -> bool:
         """Delete a specific cache entry"""
         if key in self.memory_cache:
             del self.memory_cache[key]
+            self._compact_expiry_heap()
             return True
         return False
     
     def clear(self) -> None:
         """Clear all cache entries"""
         self.memory_cache.clear()
+        self._expiry_heap.clear()
         self.cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
     
     def cleanup_expired(self) -> int:
         """Remove all expired entries and return count removed"""
         current_time = time.time()
-        expired_keys = []
-        
-        for key, entry in self.memory_cache.items():
-            if self._is_expired(entry):
-                expired_keys.append(key)
+        heap = self._expiry_heap
+        removed = 0
         
-        for key in expired_keys:
-            del self.memory_cache[key]
-            self.cache_stats['evictions'] += 1
+        while heap and heap[0][0] < current_time:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self.memory_cache.get(key)
+            # Skip heap records left behind by deletes or by a later set of the same key
+            if entry is not None and entry['expires_at'] == expires_at:
+                del self.memory_cache[key]
+                self.cache_stats['evictions'] += 1
+                removed += 1
         
-        return len(expired_keys)
+        return removed
     
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -107,12 +180,12 @@ class CacheManager:
         
         for key, entry in self.memory_cache.items():
             info = {
-                'key': key[:16] + '...' if len(key) > 16 else key,
+                'key': str(key)[:16] + '...' if len(str(key)) > 16 else str(key),
                 'created_ago': round(current_time - entry['created_at'], 2),
                 'last_accessed_ago': round(current_time - entry['last_accessed'], 2),
                 'expires_in': round(entry['expires_at'] - current_time, 2) if entry['expires_at'] else 'Never',
                 'ttl': entry['ttl'],
-                'is_expired': self._is_expired(entry)
+                'is_expired': self._is_expired(entry, current_time)
             }
             entries_info.append(info)
         
@@ -125,9 +198,18 @@ class CacheManager:
         """Decorator for caching function results"""
         def decorator(func: Callable):
             def wrapper(*args, **kwargs):
-                # Generate cache key
+                # Scalar arguments key the cache directly, tagged with their type so
+                # 1, 1.0 and True stay distinct; anything else is hashed
                 func_key = f"{key_prefix}{func.__name__}"
-                cache_key = self._generate_cache_key(func_key, *args, **kwargs)
+                if all(type(a) in _SCALAR_KEY_TYPES for a in args) and \
+                        all(type(v) in _SCALAR_KEY_TYPES for v in kwargs.values()):
+                    cache_key = (
+                        func_key,
+                        tuple((type(a), a) for a in args),
+                        tuple((k, type(v), v) for k, v in sorted(kwargs.items()))
+                    )
+                else:
+                    cache_key = self._generate_cache_key(func_key, *args, **kwargs)
                 
                 # Try to get from cache
                 cached_result = self.get(cache_key)
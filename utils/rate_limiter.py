@@ -1,9 +1,13 @@
+import threading
 import time
+from collections import deque
 from typing import Dict, Optional
 
 class RateLimiter:
     """Token bucket rate limiter for API requests"""
     
+    __slots__ = ('max_requests', 'time_window', 'request_times', 'request_count', 'window_start', '_lock')
+    
     def __init__(self, max_requests: int = 100, time_window: int = 300):
         """
         Initialize rate limiter
@@ -14,9 +18,12 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.request_times = []
+        # Timestamps are appended in order, so the oldest is always at the left
+        self.request_times = deque()
         self.request_count = 0
         self.window_start = time.time()
+        # Clients are shared across sessions and fetch concurrently
+        self._lock = threading.RLock()
     
     def can_make_request(self) -> bool:
         """Check if a request can be made within rate limits"""
@@ -25,32 +32,37 @@ class RateLimiter:
     
     def record_request(self) -> None:
         """Record a new request timestamp"""
-        current_time = time.time()
-        self.request_times.append(current_time)
-        self.request_count += 1
-        self._cleanup_old_requests()
+        with self._lock:
+            current_time = time.time()
+            self.request_times.append(current_time)
+            self.request_count += 1
+            self._cleanup_old_requests(current_time)
     
-    def _cleanup_old_requests(self) -> None:
+    def _cleanup_old_requests(self, current_time: Optional[float] = None) -> None:
         """Remove request timestamps outside the time window"""
-        current_time = time.time()
-        cutoff_time = current_time - self.time_window
-        
-        # Remove old requests
-        self.request_times = [t for t in self.request_times if t > cutoff_time]
-        
-        # Reset window if needed
-        if current_time - self.window_start > self.time_window:
-            self.window_start = current_time
-            self.request_count = len(self.request_times)
+        with self._lock:
+            if current_time is None:
+                current_time = time.time()
+            cutoff_time = current_time - self.time_window
+            
+            # Remove old requests
+            request_times = self.request_times
+            while request_times and request_times[0] <= cutoff_time:
+                request_times.popleft()
+            
+            # Reset window if needed
+            if current_time - self.window_start > self.time_window:
+                self.window_start = current_time
+                self.request_count = len(self.request_times)
     
-    def get_time_until_reset(self) -> float:
+    def get_time_until_reset(self, current_time: Optional[float] = None) -> float:
         """Get seconds until rate limit resets"""
         if not self.request_times:
             return 0
         
-        oldest_request = min(self.request_times)
+        oldest_request = self.request_times[0]
         reset_time = oldest_request + self.time_window
-        return max(0, reset_time - time.time())
+        return max(0, reset_time - (time.time() if current_time is None else current_time))
     
     def get_remaining_requests(self) -> int:
         """Get number of remaining requests in current window"""
@@ -59,14 +71,17 @@ class RateLimiter:
     
     def get_status(self) -> Dict[str, any]:
         """Get current rate limit status"""
-        self._cleanup_old_requests()
+        # One clock read and one cleanup for the whole snapshot
+        current_time = time.time()
+        self._cleanup_old_requests(current_time)
+        requests_made = len(self.request_times)
         return {
-            'requests_made': len(self.request_times),
-            'requests_remaining': self.get_remaining_requests(),
-            'time_until_reset': self.get_time_until_reset(),
-            'can_make_request': self.can_make_request(),
+            'requests_made': requests_made,
+            'requests_remaining': max(0, self.max_requests - requests_made),
+            'time_until_reset': self.get_time_until_reset(current_time),
+            'can_make_request': requests_made < self.max_requests,
             'window_start': self.window_start,
-            'current_time': time.time()
+            'current_time': current_time
         }
     
     def wait_if_needed(self) -> Optional[float]: